@@ -7,7 +7,6 @@ from typing import NamedTuple
 
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_datetime64_dtype, is_numeric_dtype
 from pandas.testing import assert_frame_equal
 
 import transpose
@@ -21,20 +20,21 @@ class DefaultSettings(NamedTuple):
     MAX_BYTES_PER_COLUMN_NAME: int = 100
 
 
-def render(table, firstcolname="", input_columns=None, settings=DefaultSettings()):
-    def _infer_type(series):
-        if is_numeric_dtype(series):
-            return "number"
-        elif is_datetime64_dtype(series):
-            return "timestamp"
-        else:
-            return "text"
+_COLUMN_TYPE_BY_DTYPE_KIND = {
+    "b": "number",
+    "i": "number",
+    "u": "number",
+    "f": "number",
+    "M": "timestamp",
+}
 
-    def _infer_column(colname):
-        return Column(colname, _infer_type(table[colname]))
 
+def render(table, firstcolname="", input_columns=None, settings=DefaultSettings()):
     if input_columns is None:
-        input_columns = {c: _infer_column(c) for c in table.columns}
+        input_columns = {
+            c: Column(c, _COLUMN_TYPE_BY_DTYPE_KIND.get(dtype.kind, "text"))
+            for c, dtype in table.dtypes.items()
+        }
 
     return transpose.render(
         table,
@@ -93,6 +93,20 @@ class RenderTest(unittest.TestCase):
         result = render(table)
         assert_frame_equal(result, pd.DataFrame({"A": ["B"]}))
 
+    def test_empty_input_with_mixed_types_does_not_warn(self):
+        # There are no values, so nothing gets converted to text
+        table = pd.DataFrame(
+            {"A": pd.Series([], dtype=object), "B": [], "C": pd.Series([], dtype=int)}
+        )
+        result = render(table)
+        assert_frame_equal(result, pd.DataFrame({"A": ["B", "C"]}))
+
+    def test_only_header_column(self):
+        # Each row becomes a column; there are no other columns => no rows
+        result = render(pd.DataFrame({"A": ["x", "y"]}))
+        self.assertEqual(list(result.columns), ["A", "x", "y"])
+        self.assertEqual(len(result), 0)
+
     def test_colnames_to_str(self):
         #     A   B  C
         #  0  b   c  d
@@ -231,6 +245,20 @@ class RenderTest(unittest.TestCase):
             ],
         )
 
+    def test_convert_to_text_keeps_nulls(self):
+        table = pd.DataFrame({"A": ["x", "y"], "B": ["b", None], "C": [1.5, np.nan]})
+        result = render(table)
+        assert_frame_equal(
+            result[0],
+            pd.DataFrame(
+                {
+                    "A": ["B", "C"],
+                    "x": ["b", "1.5"],
+                    "y": pd.Series([None, np.nan], dtype=object),
+                }
+            ),
+        )
+
     def test_allow_max_n_columns(self):
         table = pd.DataFrame(
             {
@@ -278,6 +306,14 @@ class RenderTest(unittest.TestCase):
             [i18n_message("warnings.tooManyRows", {"max_columns": 3})],
         )
 
+    def test_same_type_columns_keep_their_dtype(self):
+        # No conversion to text when all non-header columns share a type
+        table = pd.DataFrame({"A": ["x", "y"], "B": [1, 2], "C": [3, 4]})
+        result = render(table)
+        assert_frame_equal(
+            result, pd.DataFrame({"A": ["B", "C"], "x": [1, 3], "y": [2, 4]})
+        )
+
     def test_transpose_categorical_and_rename_index(self):
         # Avoid TypeError: cannot insert an item into a CategoricalIndex
         # that is not already an existing category
@@ -296,6 +332,27 @@ class RenderTest(unittest.TestCase):
             result, pd.DataFrame({"X": ["B"], "a1": ["b1"], "a2": ["b2"]})
         )
 
+    def test_transpose_categorical_with_null_header(self):
+        table = pd.DataFrame(
+            {
+                "A": pd.Series(["a1", None], dtype="category"),
+                "B": pd.Series(["b1", "b2"]),
+            }
+        )
+        result = render(table)
+        self.assertEqual(
+            result[1],
+            [
+                cjwmodule_i18n_message(
+                    "util.colnames.warnings.default",
+                    {"n_columns": 1, "first_colname": "Column 3"},
+                )
+            ],
+        )
+        assert_frame_equal(
+            result[0], pd.DataFrame({"A": ["B"], "a1": ["b1"], "Column 3": ["b2"]})
+        )
+
     def test_warn_and_rename_column_if_firstcolname_conflicts(self):
         table = pd.DataFrame({"X": ["B", "C"], "A": ["c", "d"]})
         result = render(table, firstcolname="B")
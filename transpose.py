@@ -1,4 +1,4 @@
-from typing import Iterator, List, NamedTuple, Protocol, Set
+from typing import Dict, Iterator, List, NamedTuple, Protocol, Set
 
 import numpy as np
 import pandas as pd
@@ -21,132 +21,224 @@ class GenColnamesResult(NamedTuple):
 
 
 def _gen_colnames_and_warn(
-    first_colname: str, first_column: pd.Series, settings: Settings
+    first_colname: str, column: str, headers: np.ndarray, settings: Settings
 ) -> GenColnamesResult:
     """
     Generate transposed-table column names.
 
-    If `first_colname` is empty, `column.name` is the first output column. If
+    If `first_colname` is empty, `column` is the first output column. If
     both are empty, auto-generate the column name (and warn).
 
     Warn if ASCII-cleaning names, renaming duplicates, truncating names or
     auto-generating names.
 
-    Assume `first_column` is text without nulls.
+    Assume `headers` is an object ndarray of str, without nulls.
     """
-    input_names = [first_colname or first_column.name]
-    input_names.extend(list(first_column.values))
+    input_names = [first_colname or column]
+    input_names.extend(headers.tolist())  # one C-level pass over the buffer
 
     names, warnings = gen_unique_clean_colnames_and_warn(input_names, settings=settings)
 
     return GenColnamesResult(names, warnings)
 
 
+def _to_text(series: pd.Series, na_value) -> np.ndarray:
+    """
+    Convert `series` to an object ndarray of str, with `na_value` for null.
+
+    * number => str, formatted by NumPy in C. (NumPy's formatting matches
+      Python's `str()`, which is what `series.astype(str)` calls per value.)
+    * categorical => each category converted once, then looked up by code
+    * text => as-is: Workbench text values are already str
+    * anything else (timestamp) => `series.astype(str)`
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Append na_value so code -1 (null) selects it: one lookup, no mask.
+        lookup = np.append(series.cat.categories.astype(str).to_numpy(), na_value)
+        return lookup[series.cat.codes.to_numpy()]
+
+    values = series.to_numpy()
+    if values.dtype.kind in "iuf":
+        ret = values.astype(str).astype(object)
+        if values.dtype.kind == "f":
+            ret[np.isnan(values)] = na_value
+        return ret
+
+    if values.dtype == object:
+        # Workbench text holds only str and null: there's nothing to convert.
+        # Skip the copy entirely if there are no nulls to replace.
+        na = pd.isna(values)
+        if na.any():
+            values = values.copy()
+            values[na] = na_value
+        return values
+
+    na = series.isna().to_numpy()
+    ret = series.astype(str).to_numpy()
+    ret[na] = na_value
+    return ret
+
+
+def _names_index(names: List[str]) -> pd.Index:
+    """
+    Build an output-column Index from generated `names`.
+
+    Names are all str: build their Index from one object ndarray, so pandas
+    needn't infer its dtype.
+    """
+    return pd.Index(np.array(names, dtype=object), dtype=object, copy=False)
+
+
+def _transpose_values(
+    values: np.ndarray, colnames: pd.Index, names: List[str]
+) -> pd.DataFrame:
+    """
+    Build the transposed table: `colnames` first, then one column per row.
+
+    `values` has shape (n_rows, n_columns). `names` are the output column
+    names (including the first column's).
+
+    We transpose the 2-D ndarray rather than calling `table.T`: NumPy's
+    transpose just swaps strides, and pandas builds a single block from it.
+    (`table.T` would build pandas' BlockManager twice and `reset_index()`
+    would copy everything a third time.)
+    """
+    # dtype=values.dtype: with dtype=None, pandas scans each object column
+    # hoping to infer datetimes. `table.T` never did that, and it's slow.
+    ret = pd.DataFrame(
+        values.T, columns=_names_index(names[1:]), dtype=values.dtype, copy=False
+    )
+    ret.insert(0, names[0], colnames)
+    return ret
+
+
+def _transpose_to_text(
+    table: pd.DataFrame, column_types: Dict[str, str], names: List[str]
+) -> pd.DataFrame:
+    """
+    Build the transposed table, converting non-text columns to text.
+
+    Like `_transpose_values()`, but everything -- including the first output
+    column, `table.columns` -- lands in one object ndarray we allocate once.
+    (Assigning `table[colname] = ...` would add a pandas block per column.)
+    """
+    n_rows, n_columns = table.shape
+    values = np.empty((n_rows + 1, n_columns), dtype=object)
+    values[0] = table.columns
+    for i, (colname, series) in enumerate(table.items()):
+        if column_types[colname] == "text":
+            values[1:, i] = series.to_numpy()
+        else:
+            # TODO respect column formats ... and nix the quick-fix?
+            values[1:, i] = _to_text(series, np.nan)
+    return pd.DataFrame(values.T, columns=_names_index(names), dtype=object, copy=False)
+
+
+def _headers_converted_to_text_warning(colname: str):
+    return {
+        "message": i18n.trans(
+            "warnings.headersConvertedToText.message",
+            'Headers in column "{column_name}" were auto-converted to text.',
+            {"column_name": colname},
+        ),
+        "quickFixes": [
+            {
+                "text": i18n.trans(
+                    "warnings.headersConvertedToText.quickFix.text",
+                    "Convert {column_name} to text",
+                    {"column_name": f'"{colname}"'},
+                ),
+                "action": "prependModule",
+                "args": ["converttotext", {"colnames": [colname]}],
+            }
+        ],
+    }
+
+
+def _different_column_types_warning(colnames: List[str]):
+    return {
+        "message": i18n.trans(
+            "warnings.differentColumnTypes.message",
+            '{n_columns, plural, other {# columns (see "{first_colname}") were} one {Column "{first_colname}" was}} '
+            "auto-converted to Text because all columns must have the same type.",
+            {"n_columns": len(colnames), "first_colname": colnames[0]},
+        ),
+        "quickFixes": [
+            {
+                "text": i18n.trans(
+                    "warnings.differentColumnTypes.quickFix.text",
+                    "Convert {n_columns, plural, other {# columns} one {# column}} to text",
+                    {"n_columns": len(colnames)},
+                ),
+                "action": "prependModule",
+                "args": ["converttotext", {"colnames": colnames}],
+            }
+        ],
+    }
+
+
 def render(table, params, *, input_columns, settings: Settings):
+    if not len(table.columns):
+        # happens if we're the first module in the module stack
+        return pd.DataFrame()
+
     warnings = []
     colnames_auto_converted_to_text = []
 
-    if len(table) > settings.MAX_COLUMNS_PER_TABLE:
-        table = table.truncate(after=settings.MAX_COLUMNS_PER_TABLE - 1)
+    max_columns = settings.MAX_COLUMNS_PER_TABLE
+    if len(table) > max_columns:
+        # Positional slice: a view of the existing blocks. (truncate() would
+        # search the index by label, and copy by default.)
+        table = table.iloc[:max_columns]
         warnings.append(
             i18n.trans(
                 "warnings.tooManyRows",
                 "We truncated the input to {max_columns} rows so the "
                 "transposed table would have a reasonable number of columns.",
-                {"max_columns": settings.MAX_COLUMNS_PER_TABLE},
+                {"max_columns": max_columns},
             )
         )
 
-    if not len(table.columns):
-        # happens if we're the first module in the module stack
-        return pd.DataFrame()
-
     column = table.columns[0]
-    first_column = table[column]
-    table.drop(column, axis=1, inplace=True)
+    first_column = table.iloc[:, 0]
+    table = table.iloc[:, 1:]  # a view: we only read it from here on
+    colnames = table.columns
+    column_types = {name: c.type for name, c in input_columns.items()}
 
-    if input_columns[column].type != "text":
-        warnings.append(
-            {
-                "message": i18n.trans(
-                    "warnings.headersConvertedToText.message",
-                    'Headers in column "{column_name}" were auto-converted to text.',
-                    {"column_name": column},
-                ),
-                "quickFixes": [
-                    {
-                        "text": i18n.trans(
-                            "warnings.headersConvertedToText.quickFix.text",
-                            "Convert {column_name} to text",
-                            {"column_name": '"%s"' % column},
-                        ),
-                        "action": "prependModule",
-                        "args": [
-                            "converttotext",
-                            {"colnames": [column]},
-                        ],
-                    }
-                ],
-            }
-        )
+    if column_types[column] != "text":
+        warnings.append(_headers_converted_to_text_warning(column))
 
     # Ensure headers are string. (They will become column names.)
-    # * categorical => str
-    # * nan => ""
-    # * non-text => str
-    na = first_column.isna()
-    first_column = first_column.astype(str)
-    first_column[na] = ""  # Empty values are all equivalent
+    # Empty values are all equivalent: they all become "".
+    headers = _to_text(first_column, "")
 
     gen_headers_result = _gen_colnames_and_warn(
-        params["firstcolname"], first_column, settings
+        params["firstcolname"], column, headers, settings
     )
     warnings.extend(gen_headers_result.warnings)
 
-    input_types = set(c.type for c in input_columns.values() if c.name != column)
+    if not len(table):
+        # No rows => no values to convert or transpose. The output is just
+        # the former column names.
+        ret = pd.DataFrame({gen_headers_result.names[0]: colnames})
+        if warnings:
+            return (ret, warnings)
+        else:
+            return ret
+
+    input_types = set(t for name, t in column_types.items() if name != column)
     if len(input_types) > 1:
         # Convert everything to text before converting. (All values must have
         # the same type.)
-        to_convert = [c for c in table.columns if input_columns[c].type != "text"]
+        to_convert = [c for c in colnames if column_types[c] != "text"]
         if to_convert:
-            warnings.append(
-                {
-                    "message": i18n.trans(
-                        "warnings.differentColumnTypes.message",
-                        '{n_columns, plural, other {# columns (see "{first_colname}") were} one {Column "{first_colname}" was}} '
-                        "auto-converted to Text because all columns must have the same type.",
-                        {"n_columns": len(to_convert), "first_colname": to_convert[0]},
-                    ),
-                    "quickFixes": [
-                        {
-                            "text": i18n.trans(
-                                "warnings.differentColumnTypes.quickFix.text",
-                                "Convert {n_columns, plural, other {# columns} one {# column}} to text",
-                                {"n_columns": len(to_convert)},
-                            ),
-                            "action": "prependModule",
-                            "args": [
-                                "converttotext",
-                                {"colnames": to_convert},
-                            ],
-                        }
-                    ],
-                }
-            )
+            warnings.append(_different_column_types_warning(to_convert))
 
-        for colname in to_convert:
-            # TODO respect column formats ... and nix the quick-fix?
-            na = table[colname].isnull()
-            table[colname] = table[colname].astype(str)
-            table[colname][na] = np.nan
-
-    # The actual transpose
-    table.index = gen_headers_result.names[1:]
-    ret = table.T
-    # Set the name of the index: it will become the name of the first column.
-    ret.index.name = gen_headers_result.names[0]
-    # Make the index (former colnames) a column
-    ret.reset_index(inplace=True)
+        # The actual transpose
+        ret = _transpose_to_text(table, column_types, gen_headers_result.names)
+    else:
+        # The actual transpose. to_numpy() gives the same dtype as table.T.
+        ret = _transpose_values(table.to_numpy(), colnames, gen_headers_result.names)
 
     if warnings:
         return (ret, warnings)